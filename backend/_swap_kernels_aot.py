@@ -0,0 +1,65 @@
+"""AOT build script for the swap pricing kernels.
+
+Run ``python -m backend._swap_kernels_aot`` at build time to compile
+``swap_kernels.<abi>.so`` next to this file.  ``swap_pricer`` imports
+the native module when present and falls back to its JIT kernels
+otherwise, so the artifact is optional: shipping it just removes the
+first-call compile pause from fresh processes.
+
+The exports mirror the JIT kernels but take preallocated output arrays,
+since AOT signatures are easiest to keep stable with plain buffers.
+"""
+
+import math
+import os
+
+from numba.pycc import CC
+
+cc = CC('swap_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('interp_zero_many', 'void(f8[:], f8[:], f8[:], f8[:])')
+def interp_zero_many(tenors, rates, points, out):
+    """Linear interpolation on a sorted curve, flat beyond the ends."""
+    n = tenors.shape[0]
+    for i in range(points.shape[0]):
+        x = points[i]
+        idx = 0
+        while idx < n and tenors[idx] < x:
+            idx += 1
+        if idx == 0:
+            out[i] = rates[0]
+        elif idx == n:
+            out[i] = rates[n - 1]
+        else:
+            lo = tenors[idx - 1]
+            hi = tenors[idx]
+            w = (x - lo) / (hi - lo)
+            out[i] = rates[idx - 1] + w * (rates[idx] - rates[idx - 1])
+
+
+@cc.export('price_legs',
+           'f8(f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8, f8, f8, '
+           'f8[:], f8[:], f8[:], f8[:])')
+def price_legs(times_start, times_end, year_fracs, z_start, z_end, disc_z,
+               notional, fixed_rate, spread, float_fwds, dfs, fixed_pvs,
+               float_pvs):
+    """Both legs' forwards, discount factors and PVs; returns the annuity."""
+    annuity = 0.0
+    for i in range(times_end.shape[0]):
+        t_s = times_start[i]
+        t_e = times_end[i]
+        yf = year_fracs[i]
+        fwd = (z_end[i] * t_e - z_start[i] * t_s) / (t_e - t_s) + spread
+        df = math.exp(-disc_z[i] * t_e)
+        float_fwds[i] = fwd
+        dfs[i] = df
+        fixed_pvs[i] = notional * fixed_rate * yf * df
+        float_pvs[i] = notional * fwd * yf * df
+        annuity += yf * df
+    return annuity
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -0,0 +1,386 @@
+"""Rate alert management for AUD/NZD swap rates.
+
+Alerts are persisted as MessagePack via msgspec, which serializes an
+order of magnitude faster than stdlib json and produces smaller files.
+Mutations are appended to a length-prefixed MessagePack journal rather
+than rewriting the whole snapshot, so bytes written per mutation are
+proportional to the delta; the journal is compacted back into the
+snapshot once it outgrows it.  A ``.json`` export path is kept for
+external consumers.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import msgspec
+import numpy as np
+from numba import njit, prange
+
+
+class AlertConditions:
+    """Supported alert trigger conditions."""
+
+    ABOVE = 'above'
+    BELOW = 'below'
+    CROSSES_ABOVE = 'crosses_above'
+    CROSSES_BELOW = 'crosses_below'
+    CHANGE = 'change'
+
+    @staticmethod
+    def get_all():
+        return _ALL_CONDITIONS
+
+    @staticmethod
+    def get_description(condition):
+        return _ALERT_DESCRIPTIONS.get(condition, "Unknown condition")
+
+
+# Built once at import; get_description/get_all allocate nothing per call.
+_ALL_CONDITIONS = (
+    AlertConditions.ABOVE,
+    AlertConditions.BELOW,
+    AlertConditions.CROSSES_ABOVE,
+    AlertConditions.CROSSES_BELOW,
+    AlertConditions.CHANGE,
+)
+
+_ALERT_DESCRIPTIONS = {
+    AlertConditions.ABOVE: "Rate is above threshold",
+    AlertConditions.BELOW: "Rate is below threshold",
+    AlertConditions.CROSSES_ABOVE: "Rate crosses above threshold",
+    AlertConditions.CROSSES_BELOW: "Rate crosses below threshold",
+    AlertConditions.CHANGE: "Absolute day-on-day change exceeds threshold",
+}
+
+
+# Resolved and created once at import; AlertManager construction then
+# costs no path normalization or mkdir syscall per instance.
+_ALERTS_DIR = Path(__file__).resolve().parent.parent / 'database'
+_ALERTS_DIR.mkdir(exist_ok=True)
+
+
+# Integer encoding of the conditions for the jitted evaluation kernel.
+_CONDITION_CODES = {
+    AlertConditions.ABOVE: 0,
+    AlertConditions.BELOW: 1,
+    AlertConditions.CROSSES_ABOVE: 2,
+    AlertConditions.CROSSES_BELOW: 3,
+    AlertConditions.CHANGE: 4,
+}
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _eval_conditions(cur, prev, has_prev, thresholds, conditions, out):
+    """Evaluate all alert conditions at once over SoA arrays.
+
+    Kept flat and bitwise-combined (no if/elif chain) so Numba can
+    vectorize the loop body.
+    """
+    for i in prange(cur.shape[0]):
+        c = conditions[i]
+        x = cur[i]
+        p = prev[i]
+        t = thresholds[i]
+        hp = has_prev[i]
+        out[i] = (((c == 0) & (x > t)) |
+                  ((c == 1) & (x < t)) |
+                  ((c == 2) & hp & (p <= t) & (x > t)) |
+                  ((c == 3) & hp & (p >= t) & (x < t)) |
+                  ((c == 4) & hp & (abs(x - p) >= t)))
+
+
+class AlertRecord(msgspec.Struct):
+    """A single rate alert.  Rates/thresholds are in percent."""
+
+    id: int
+    currency: str
+    tenor: str
+    condition: str
+    threshold: float
+    enabled: bool = True
+    created: str = ''
+    last_checked: str | None = None
+    last_triggered: str | None = None
+    trigger_count: int = 0
+
+
+class AlertManager:
+    """Creates, persists and evaluates rate alerts against the rates DB."""
+
+    def __init__(self, db_manager, alerts_file='alerts.msgpack'):
+        self.db_manager = db_manager
+        self.alerts_file = _ALERTS_DIR / alerts_file
+        self.journal_file = self.alerts_file.with_suffix('.log')
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder(list[AlertRecord])
+        self.alerts = self.load_alerts()
+        self._by_id = {a.id: a for a in self.alerts}
+        self._journal = open(self.journal_file, 'ab')
+        # SoA condition table for the jitted evaluator; rebuilt lazily
+        # after mutations.
+        self._table_dirty = True
+        self._table_alerts = []
+        self._thresholds = np.empty(0, dtype=np.float64)
+        self._conditions = np.empty(0, dtype=np.int8)
+        self._pair_keys = []
+        self._currencies = set()
+        self._prev_pairs = []
+
+    # ------------------------------------------------------------------
+    # persistence
+    # ------------------------------------------------------------------
+
+    def load_alerts(self):
+        """Load the snapshot, then replay the mutation journal on top."""
+        alerts = []
+        if self.alerts_file.exists():
+            data = self.alerts_file.read_bytes()
+            if data:
+                alerts = self._decoder.decode(data)
+        if self.journal_file.exists():
+            self._replay_journal(alerts)
+        return alerts
+
+    def _replay_journal(self, alerts):
+        """Apply journalled mutations (length-prefixed msgpack) in order."""
+        by_id = {a.id: a for a in alerts}
+        data = self.journal_file.read_bytes()
+        pos = 0
+        while pos + 4 <= len(data):
+            length = int.from_bytes(data[pos:pos + 4], 'big')
+            pos += 4
+            if pos + length > len(data):
+                break  # truncated trailing record; drop it
+            entry = msgspec.msgpack.decode(data[pos:pos + length])
+            pos += length
+            op = entry['op']
+            if op == 'add':
+                record = msgspec.convert(entry['record'], AlertRecord)
+                alerts.append(record)
+                by_id[record.id] = record
+            elif op == 'update':
+                alert = by_id.get(entry['id'])
+                if alert is not None:
+                    for field, value in entry['fields'].items():
+                        setattr(alert, field, value)
+            elif op == 'remove':
+                alert = by_id.pop(entry['id'], None)
+                if alert is not None:
+                    alerts.remove(alert)
+            elif op == 'check':
+                ts = entry['ts']
+                for alert_id in entry['checked']:
+                    alert = by_id.get(alert_id)
+                    if alert is not None:
+                        alert.last_checked = ts
+                for alert_id in entry['triggered']:
+                    alert = by_id.get(alert_id)
+                    if alert is not None:
+                        alert.last_triggered = ts
+                        alert.trigger_count += 1
+
+    def _append(self, entry):
+        """Append one journal entry; compact once the log outgrows the snapshot."""
+        payload = self._encoder.encode(entry)
+        self._journal.write(len(payload).to_bytes(4, 'big'))
+        self._journal.write(payload)
+        self._journal.flush()
+        snapshot_size = max(
+            self.alerts_file.stat().st_size if self.alerts_file.exists() else 0,
+            1024,
+        )
+        if self._journal.tell() > 4 * snapshot_size:
+            self.compact()
+
+    def compact(self):
+        """Rewrite the full snapshot and truncate the journal."""
+        self.save_alerts()
+        self._journal.truncate(0)
+        self._journal.seek(0)
+
+    def save_alerts(self):
+        """Write the full alert list back to disk as MessagePack."""
+        self.alerts_file.write_bytes(self._encoder.encode(self.alerts))
+
+    def export_json(self, path):
+        """Write a human-readable JSON copy for external consumers."""
+        records = [msgspec.structs.asdict(a) for a in self.alerts]
+        with open(path, 'w') as f:
+            json.dump(records, f, indent=2)
+
+    # ------------------------------------------------------------------
+    # mutations
+    # ------------------------------------------------------------------
+
+    def add_alert(self, currency, tenor, condition, threshold):
+        """Create a new alert and persist it.  Returns the new record."""
+        # max over live ids, not len(): deletions must not recycle ids.
+        next_id = (max(self._by_id) if self._by_id else 0) + 1
+        alert = AlertRecord(
+            id=next_id,
+            currency=currency.upper(),
+            tenor=tenor.upper(),
+            condition=condition,
+            threshold=float(threshold),
+            created=datetime.now().isoformat(),
+        )
+        self.alerts.append(alert)
+        self._by_id[alert.id] = alert
+        self._table_dirty = True
+        self._append({'op': 'add', 'record': msgspec.structs.asdict(alert)})
+        return alert
+
+    def remove_alert(self, alert_id):
+        if self._by_id.pop(alert_id, None) is None:
+            return False
+        self.alerts = list(self._by_id.values())
+        self._table_dirty = True
+        self._append({'op': 'remove', 'id': alert_id})
+        return True
+
+    def update_alert(self, alert_id, **updates):
+        alert = self._by_id.get(alert_id)
+        if alert is None:
+            return None
+        for field, value in updates.items():
+            setattr(alert, field, value)
+        self._table_dirty = True
+        self._append({'op': 'update', 'id': alert_id, 'fields': updates})
+        return alert
+
+    def enable_alert(self, alert_id):
+        return self.update_alert(alert_id, enabled=True)
+
+    def disable_alert(self, alert_id):
+        return self.update_alert(alert_id, enabled=False)
+
+    def get_alerts(self, enabled_only=False):
+        if enabled_only:
+            return [a for a in self.alerts if a.enabled]
+        return list(self.alerts)
+
+    # ------------------------------------------------------------------
+    # evaluation
+    # ------------------------------------------------------------------
+
+    def _rebuild_condition_table(self):
+        """Rebuild the SoA arrays mirroring the enabled alerts.
+
+        Alongside thresholds/conditions we precompute each alert's
+        (currency, tenor) key and the distinct key sets, so a check pass
+        only does dict lookups — no per-alert attribute walks or set
+        rebuilds.
+        """
+        enabled = [a for a in self.alerts if a.enabled]
+        self._table_alerts = enabled
+        self._thresholds = np.fromiter((a.threshold for a in enabled),
+                                       dtype=np.float64, count=len(enabled))
+        self._conditions = np.fromiter(
+            (_CONDITION_CODES.get(a.condition, -1) for a in enabled),
+            dtype=np.int8, count=len(enabled))
+        self._pair_keys = [(a.currency, a.tenor) for a in enabled]
+        self._currencies = {a.currency for a in enabled}
+        self._prev_pairs = sorted({
+            key for a, key in zip(enabled, self._pair_keys)
+            if a.condition in (AlertConditions.CROSSES_ABOVE,
+                               AlertConditions.CROSSES_BELOW,
+                               AlertConditions.CHANGE)
+        })
+        self._table_dirty = False
+
+    def check_alerts(self):
+        """Evaluate every enabled alert against the latest rates.
+
+        Returns a list of trigger events.  Rates from the DB are decimal
+        fractions; alerts work in percent, so values are scaled by 100.
+        """
+        triggered = []
+        checked_ids = []
+        now = datetime.now().isoformat()
+
+        if self._table_dirty:
+            self._rebuild_condition_table()
+        enabled = self._table_alerts
+        if not enabled:
+            return triggered
+
+        # Prefetch once per pass: one get_latest_rates call per currency
+        # and a single bulk query for the previous fixings, instead of a
+        # DB round-trip per alert.
+        latest = {}
+        for currency in self._currencies:
+            for rate in self.db_manager.get_latest_rates(currency):
+                latest[(currency, rate.tenor)] = rate.rate * 100
+
+        previous = {}
+        if self._prev_pairs:
+            history = self.db_manager.get_rates_bulk(self._prev_pairs, limit=2)
+            for pair, rows in history.items():
+                if len(rows) >= 2:
+                    previous[pair] = rows[1].rate * 100
+
+        # SoA inputs for the jitted kernel; alerts without a current rate
+        # are masked out afterwards.
+        n = len(enabled)
+        cur = np.zeros(n, dtype=np.float64)
+        prev = np.zeros(n, dtype=np.float64)
+        has_prev = np.zeros(n, dtype=np.bool_)
+        valid = np.zeros(n, dtype=np.bool_)
+        for i, key in enumerate(self._pair_keys):
+            rate = latest.get(key)
+            if rate is None:
+                continue
+            valid[i] = True
+            cur[i] = rate
+            prev_rate = previous.get(key)
+            if prev_rate is not None:
+                has_prev[i] = True
+                prev[i] = prev_rate
+
+        hits = np.empty(n, dtype=np.bool_)
+        _eval_conditions(cur, prev, has_prev, self._thresholds,
+                         self._conditions, hits)
+        hits &= valid
+
+        for i, alert in enumerate(enabled):
+            if not valid[i]:
+                continue
+            alert.last_checked = now
+            checked_ids.append(alert.id)
+            if hits[i]:
+                alert.last_triggered = now
+                alert.trigger_count += 1
+                triggered.append({
+                    'alert_id': alert.id,
+                    'currency': alert.currency,
+                    'tenor': alert.tenor,
+                    'condition': alert.condition,
+                    'threshold': alert.threshold,
+                    'current_rate': cur[i],
+                    'previous_rate': prev[i] if has_prev[i] else None,
+                    'triggered_at': now,
+                })
+
+        if checked_ids:
+            self._append({
+                'op': 'check',
+                'ts': now,
+                'checked': checked_ids,
+                'triggered': [t['alert_id'] for t in triggered],
+            })
+        return triggered
+
+    def get_alert_history(self, alert_id):
+        """Return trigger bookkeeping for one alert."""
+        alert = self._by_id.get(alert_id)
+        if alert is None:
+            return None
+        return {
+            'alert_id': alert.id,
+            'last_checked': alert.last_checked,
+            'last_triggered': alert.last_triggered,
+            'trigger_count': alert.trigger_count,
+        }
@@ -0,0 +1,265 @@
+"""Analytics over stored swap rates: statistics, spreads, volatility."""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+
+@njit(fastmath=True, cache=True)
+def _mean_std(x):
+    """Population mean and std in a single pass over the array."""
+    n = x.shape[0]
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        v = x[i]
+        s += v
+        s2 += v * v
+    m = s / n
+    return m, math.sqrt(max(s2 / n - m * m, 0.0))
+
+
+@njit(fastmath=True, cache=True)
+def _zscore_mask(x, mean, std, threshold, out):
+    """Write the |z| > threshold mask without materializing z-scores."""
+    for i in range(x.shape[0]):
+        out[i] = abs(x[i] - mean) / std > threshold
+
+
+def _rate_columns(rates):
+    """Pack rate rows into (datetime64[D] dates, float64 percents) arrays.
+
+    Building typed columns up front keeps DataFrame construction columnar
+    instead of boxing every cell via a list of per-row dicts.
+    """
+    n = len(rates)
+    dates = np.empty(n, dtype='datetime64[D]')
+    vals = np.empty(n, dtype=np.float64)
+    for i, r in enumerate(rates):
+        dates[i] = r.date
+        vals[i] = r.rate
+    vals *= 100.0
+    return dates, vals
+
+
+class SwapRateAnalytics:
+    """Statistical analysis helpers on top of the rates database.
+
+    All returned rate figures are in percent.
+    """
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        # The DB driver releases the GIL during I/O, so a small pool
+        # overlaps query latency for multi-series requests.
+        self._pool = ThreadPoolExecutor(max_workers=8)
+
+    def get_multi_statistics(self, pairs):
+        """Statistics for many (currency, tenor) pairs, queries overlapped.
+
+        Returns ``[(pair, stats_or_None), ...]`` in input order.
+        """
+        return list(self._pool.map(
+            lambda pair: (pair, self.get_rate_statistics(*pair)), pairs))
+
+    def get_rate_statistics(self, currency, tenor, start_date=None, end_date=None):
+        """Summary statistics for one (currency, tenor) series."""
+        rates = self.db_manager.get_rates(currency, tenor, start_date, end_date)
+        if not rates:
+            return None
+
+        # Single array construction + one percentile call covering
+        # min/quartiles/max; avoids seven separate list->ndarray passes.
+        values = np.fromiter((r.rate for r in rates), dtype=np.float64,
+                             count=len(rates)) * 100.0
+        q = np.percentile(values, [0, 25, 50, 75, 100])
+
+        stats = {
+            'currency': currency,
+            'tenor': tenor,
+            'count': len(values),
+            'current': values[-1],
+            'mean': values.mean(),
+            'median': q[2],
+            'std': values.std(),
+            'min': q[0],
+            'q25': q[1],
+            'q75': q[3],
+            'max': q[4],
+        }
+        if len(values) > 1:
+            stats['change_1d'] = values[-1] - values[-2]
+        return stats
+
+    def _aligned_rates(self, currency, tenor1, tenor2,
+                       start_date=None, end_date=None):
+        """Two tenor series aligned on their common dates.
+
+        Returns ``(dates, rates1, rates2)`` as numpy arrays in ascending
+        date order, or None when there is no overlap.  The inner join is
+        an O(n+m) intersect on the date arrays — no pandas merge needed.
+        """
+        rates1 = self.db_manager.get_rates(currency, tenor1, start_date, end_date)
+        rates2 = self.db_manager.get_rates(currency, tenor2, start_date, end_date)
+        if not rates1 or not rates2:
+            return None
+
+        dates1, vals1 = _rate_columns(rates1)
+        dates2, vals2 = _rate_columns(rates2)
+        common, idx1, idx2 = np.intersect1d(dates1, dates2,
+                                            return_indices=True)
+        if common.size == 0:
+            return None
+        return common, vals1[idx1], vals2[idx2]
+
+    def calculate_spread(self, currency, tenor1, tenor2,
+                         start_date=None, end_date=None, data=False):
+        """Spread (tenor1 - tenor2) statistics over the overlapping dates.
+
+        Pass ``data=True`` to also receive the aligned series as a
+        DataFrame; it is skipped otherwise since building it costs more
+        than the stats themselves.
+        """
+        aligned = self._aligned_rates(currency, tenor1, tenor2,
+                                      start_date, end_date)
+        if aligned is None:
+            return None
+        dates, vals1, vals2 = aligned
+        spread = vals1 - vals2
+
+        result = {
+            'currency': currency,
+            'tenor1': tenor1,
+            'tenor2': tenor2,
+            'count': len(spread),
+            'current_spread': spread[-1],
+            'mean_spread': spread.mean(),
+            'min_spread': spread.min(),
+            'max_spread': spread.max(),
+        }
+        if data:
+            result['data'] = pd.DataFrame(
+                {'date': dates, 'rate1': vals1, 'rate2': vals2,
+                 'spread': spread},
+                copy=False)
+        return result
+
+    def calculate_correlation(self, currency, tenor1, tenor2,
+                              start_date=None, end_date=None):
+        """Correlation between two tenor series on overlapping dates."""
+        aligned = self._aligned_rates(currency, tenor1, tenor2,
+                                      start_date, end_date)
+        if aligned is None:
+            return None
+        _, vals1, vals2 = aligned
+        return {
+            'currency': currency,
+            'tenor1': tenor1,
+            'tenor2': tenor2,
+            'count': len(vals1),
+            'correlation': np.corrcoef(vals1, vals2)[0, 1],
+        }
+
+    def calculate_volatility(self, currency, tenor, window=30,
+                             start_date=None, end_date=None):
+        """Annualized rolling volatility of daily rate changes."""
+        rates = self.db_manager.get_rates(currency, tenor, start_date, end_date)
+        if len(rates) < window:
+            return None
+
+        # get_rates returns ascending dates, so no sort is needed here.
+        dates, vals = _rate_columns(rates)
+        df = pd.DataFrame({'date': dates, 'rate': vals}, copy=False)
+        df['change'] = df['rate'].diff()
+        rolling_std = df['change'].rolling(window=window).std()
+        annualized = rolling_std * np.sqrt(252)
+
+        return {
+            'currency': currency,
+            'tenor': tenor,
+            'window': window,
+            'current_volatility': annualized.iloc[-1],
+            'mean_volatility': annualized.mean(),
+            'max_volatility': annualized.max(),
+        }
+
+    def calculate_rate_changes(self, currency, tenor):
+        """Changes over standard lookback periods, in percent.
+
+        Lookback rows are resolved by binary search on the date array, so
+        holidays and gaps can't skew the window the way fixed positional
+        offsets (index 5 for a week, 21 for a month) would.
+        """
+        rates = self.db_manager.get_rates(currency, tenor)
+        if not rates:
+            return None
+
+        dates, values = _rate_columns(rates)
+
+        changes = {'currency': currency, 'tenor': tenor, 'current': values[-1]}
+        if len(values) > 1:
+            changes['change_1d'] = values[-1] - values[-2]
+        for label, days in (('change_1w', 7), ('change_1m', 30)):
+            target = dates[-1] - np.timedelta64(days, 'D')
+            if dates[0] > target:
+                continue
+            idx = np.searchsorted(dates, target)
+            changes[label] = values[-1] - values[idx]
+        ytd = self._calculate_ytd_change(dates, values)
+        if ytd is not None:
+            changes['change_ytd'] = ytd
+        return changes
+
+    def _calculate_ytd_change(self, dates, values):
+        """Change since the first observation of the current year.
+
+        Expects ascending datetime64[D] / float64 arrays.
+        """
+        current_year = dates[-1].astype('datetime64[Y]').astype(int) + 1970
+        year_start = np.datetime64(f'{current_year}-01-01')
+        idx = np.searchsorted(dates, year_start)
+        if idx >= len(values) - 1:
+            return None
+        return values[-1] - values[idx]
+
+    def find_missing_dates(self, currency, tenor=None):
+        """Business days between first and last observation with no data."""
+        rates = self.db_manager.get_rates(currency, tenor)
+        if len(rates) < 2:
+            return []
+
+        # One set-difference against pandas' C-level business-day
+        # calendar instead of a day-by-day Python walk; a holidays=
+        # calendar can slot in here later for true AU/NZ awareness.
+        have = np.array(sorted({r.date for r in rates}), dtype='datetime64[D]')
+        expected = pd.bdate_range(have[0], have[-1]).values.astype('datetime64[D]')
+        missing = np.setdiff1d(expected, have, assume_unique=True)
+        return missing.astype('O').tolist()
+
+    def detect_outliers(self, currency, tenor, threshold=3.0,
+                        start_date=None, end_date=None):
+        """Observations whose z-score exceeds ``threshold``."""
+        rates = self.db_manager.get_rates(currency, tenor, start_date, end_date)
+        if len(rates) < 3:
+            return []
+
+        values = np.fromiter((r.rate for r in rates), dtype=np.float64,
+                             count=len(rates)) * 100.0
+        # One jitted pass computes mean and std together, and a second
+        # writes only the boolean hit mask — z-scores never materialize
+        # as a full array; actual z values are recomputed for the few
+        # hits when building the result.
+        mean, std = _mean_std(values)
+        if std == 0:
+            return []
+        mask = np.empty(len(values), dtype=np.bool_)
+        _zscore_mask(values, mean, std, threshold, mask)
+
+        return [{
+            'date': rates[i].date,
+            'rate': values[i],
+            'z_score': abs(values[i] - mean) / std,
+        } for i in np.flatnonzero(mask)]
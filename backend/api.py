@@ -0,0 +1,304 @@
+"""REST API exposing swap rates, analytics and alerts."""
+
+import datetime
+import os
+import tempfile
+from datetime import date
+from functools import lru_cache
+from typing import Literal
+
+import msgspec
+import numpy as np
+import orjson
+import xlsxwriter
+from flask import Blueprint, Flask, Response, request, send_file
+from flask_cors import CORS
+
+from .alerts import AlertManager
+from .analytics import SwapRateAnalytics
+from .database_models import DatabaseManager
+
+rates_bp = Blueprint('rates', __name__)
+
+db_manager = DatabaseManager()
+analytics = SwapRateAnalytics(db_manager)
+alert_manager = AlertManager(db_manager)
+
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+SUPPORTED_CURRENCIES = frozenset({'AUD', 'NZD'})
+
+
+class RateIn(msgspec.Struct):
+    """One row of a bulk rate upload; dates parse as ISO-8601 natively."""
+
+    date: datetime.date
+    currency: Literal['AUD', 'NZD']
+    tenor: str
+    rate: float
+
+
+# One C-level pass parses, type-checks and date-converts the whole body.
+_bulk_decoder = msgspec.json.Decoder(list[RateIn])
+
+
+def _msgpack_hook(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise NotImplementedError(type(obj))
+
+
+_msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=_msgpack_hook)
+
+
+def ojsonify(obj, status=200):
+    """Encode a response with orjson instead of Flask's stdlib-json path.
+
+    Clients sending ``Accept: application/msgpack`` get MessagePack via
+    msgspec instead.
+    """
+    if 'application/msgpack' in request.headers.get('Accept', ''):
+        return Response(_msgpack_encoder.encode(obj), status=status,
+                        mimetype='application/msgpack')
+    return Response(orjson.dumps(obj, option=_ORJSON_OPTS), status=status,
+                    mimetype='application/json')
+
+
+@lru_cache(maxsize=64)
+def _render_cached(endpoint, currency, version):
+    """Serialize a cacheable payload once per (endpoint, currency, version).
+
+    ``version`` is SQLite's data_version, so any commit — from this
+    process or another one writing the same file — naturally moves the
+    cache to a fresh key and stale entries age out of the LRU.
+    """
+    if endpoint == 'latest':
+        rates = db_manager.get_latest_rates(currency)
+        payload = {'success': True, 'count': len(rates),
+                   'data': [dict(rate._mapping) for rate in rates]}
+    elif endpoint == 'dates':
+        payload = {'success': True,
+                   'data': db_manager.get_available_dates(currency)}
+    elif endpoint == 'metadata':
+        payload = {'success': True,
+                   'data': db_manager.get_metadata(currency)}
+    elif endpoint == 'tenors':
+        payload = {'success': True,
+                   'data': db_manager.get_available_tenors(currency)}
+    else:  # floating_rates
+        payload = {'success': True,
+                   'data': db_manager.get_available_floating_rates(currency)}
+    return orjson.dumps(payload, option=_ORJSON_OPTS)
+
+
+def _conditional_json(endpoint, currency):
+    """Serve a cached payload with an ETag; 304 on If-None-Match hits."""
+    version = db_manager.version
+    etag = f'{endpoint}-{currency}-{version}'
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304)
+    response = Response(_render_cached(endpoint, currency, version),
+                        mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    return response
+
+
+@rates_bp.route('/api/rates')
+def get_rates():
+    currency = request.args.get('currency', 'AUD').upper()
+    tenor = request.args.get('tenor')
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    # date.fromisoformat is a C fast path for exactly this format,
+    # roughly 10x quicker than strptime.
+    try:
+        if start_date:
+            start_date = date.fromisoformat(start_date)
+        if end_date:
+            end_date = date.fromisoformat(end_date)
+    except ValueError as exc:
+        return ojsonify({'success': False, 'error': str(exc)}, status=400)
+    rates = db_manager.get_rates(currency, tenor, start_date, end_date)
+    return ojsonify({
+        'success': True,
+        'count': len(rates),
+        'data': [dict(rate._mapping) for rate in rates],
+    })
+
+
+@rates_bp.route('/api/rates/latest/<currency>')
+def get_latest_rates(currency):
+    return _conditional_json('latest', currency.upper())
+
+
+@rates_bp.route('/api/rates/bulk', methods=['POST'])
+def bulk_add_rates():
+    try:
+        items = _bulk_decoder.decode(request.get_data())
+    except msgspec.DecodeError as exc:
+        # ValidationError carries the precise path of the bad row/field.
+        return ojsonify({'success': False, 'error': str(exc)}, status=400)
+    rates_data = [{
+        'date': item.date,
+        'currency': item.currency,
+        'tenor': item.tenor.upper(),
+        'rate': item.rate,
+    } for item in items]
+    count = db_manager.bulk_add_rates(rates_data)
+    return ojsonify({'success': True, 'count': count})
+
+
+@rates_bp.route('/api/metadata/<currency>')
+def get_metadata(currency):
+    """All metadata lists in one response, saving three round-trips."""
+    return _conditional_json('metadata', currency.upper())
+
+
+@rates_bp.route('/api/metadata/dates/<currency>')
+def get_available_dates(currency):
+    return _conditional_json('dates', currency.upper())
+
+
+@rates_bp.route('/api/metadata/tenors/<currency>')
+def get_available_tenors(currency):
+    return _conditional_json('tenors', currency.upper())
+
+
+@rates_bp.route('/api/metadata/floating_rates/<currency>')
+def get_available_floating_rates(currency):
+    return _conditional_json('floating_rates', currency.upper())
+
+
+@rates_bp.route('/api/analytics/statistics/<currency>/<tenor>')
+def get_statistics(currency, tenor):
+    stats = analytics.get_rate_statistics(currency.upper(), tenor.upper())
+    if stats is None:
+        return ojsonify({'success': False, 'error': 'no data'}, status=404)
+    return ojsonify({'success': True, 'data': stats})
+
+
+@rates_bp.route('/api/stats/batch')
+def get_stats_batch():
+    """Statistics for many series at once, e.g. ?pairs=AUD:5Y,AUD:10Y."""
+    pairs = []
+    for token in request.args.get('pairs', '').split(','):
+        token = token.strip()
+        if not token:
+            continue
+        try:
+            currency, tenor = token.split(':')
+        except ValueError:
+            return ojsonify({'success': False,
+                             'error': f'bad pair: {token}'}, status=400)
+        pairs.append((currency.upper(), tenor.upper()))
+    if not pairs:
+        return ojsonify({'success': False, 'error': 'no pairs given'},
+                        status=400)
+    results = analytics.get_multi_statistics(pairs)
+    return ojsonify({
+        'success': True,
+        'data': {f'{c}:{t}': stats for (c, t), stats in results},
+    })
+
+
+@rates_bp.route('/api/analytics/spread/<currency>/<tenor1>/<tenor2>')
+def get_spread(currency, tenor1, tenor2):
+    spread = analytics.calculate_spread(currency.upper(), tenor1.upper(),
+                                        tenor2.upper())
+    if spread is None:
+        return ojsonify({'success': False, 'error': 'no data'}, status=404)
+    return ojsonify({'success': True, 'data': spread})
+
+
+@rates_bp.route('/api/export/<currency>')
+def export_data(currency):
+    """Export a currency's rates as an Excel workbook.
+
+    Uses xlsxwriter in constant_memory mode so rows are flushed as they
+    are written instead of buffering the whole workbook in Python
+    objects the way openpyxl does.  xlsxwriter is driven directly
+    because constant_memory requires strictly row-ordered writes, which
+    pandas' column-at-a-time ``to_excel`` does not provide.
+    """
+    rates = db_manager.get_rates(currency.upper())
+    if not rates:
+        return ojsonify({'success': False, 'error': 'no data'}, status=404)
+
+    fd, output_path = tempfile.mkstemp(suffix='.xlsx')
+    os.close(fd)
+    try:
+        workbook = xlsxwriter.Workbook(output_path,
+                                       {'constant_memory': True})
+        worksheet = workbook.add_worksheet('rates')
+        worksheet.write_row(0, 0, list(rates[0]._mapping))
+        for i, rate in enumerate(rates, start=1):
+            worksheet.write_row(i, 0, tuple(rate))
+        workbook.close()
+        response = send_file(
+            output_path,
+            as_attachment=True,
+            download_name=f'{currency.upper()}_swap_rates.xlsx',
+            conditional=True,
+        )
+    finally:
+        # send_file opened the file, so unlinking now reclaims the
+        # temp dir while the open descriptor keeps the download alive
+        # (POSIX semantics; we only deploy on Linux).  On the error
+        # path the same unlink removes the partial workbook.
+        os.unlink(output_path)
+    return response
+
+
+@rates_bp.route('/api/alerts', methods=['GET'])
+def get_alerts():
+    alerts = alert_manager.get_alerts()
+    return ojsonify({'success': True,
+                    'data': [msgspec.structs.asdict(a) for a in alerts]})
+
+
+@rates_bp.route('/api/alerts', methods=['POST'])
+def add_alert():
+    data = request.json
+    alert = alert_manager.add_alert(
+        data['currency'], data['tenor'], data['condition'],
+        data['threshold'])
+    return ojsonify({'success': True, 'data': {'id': alert.id}}, status=201)
+
+
+@rates_bp.route('/api/alerts/<int:alert_id>', methods=['DELETE'])
+def remove_alert(alert_id):
+    if not alert_manager.remove_alert(alert_id):
+        return ojsonify({'success': False, 'error': 'not found'}, status=404)
+    return ojsonify({'success': True})
+
+
+@rates_bp.route('/api/alerts/check', methods=['POST'])
+def check_alerts():
+    triggered = alert_manager.check_alerts()
+    return ojsonify({'success': True, 'count': len(triggered),
+                    'data': triggered})
+
+
+def create_app():
+    """Application factory, suitable for gunicorn's ``api:create_app()``."""
+    app = Flask(__name__)
+    app.json.sort_keys = False
+    # Pinned origins plus a cached preflight beat wildcard processing on
+    # every response.
+    CORS(app,
+         origins=os.environ.get('RATEEDGE_CORS_ORIGINS', '*').split(','),
+         max_age=86400)
+    app.register_blueprint(rates_bp)
+    return app
+
+
+if __name__ == '__main__':
+    # Dev server only; production runs behind a WSGI server.  Run ONE
+    # worker with threads: alert state (the in-memory list plus the
+    # journalled alerts.log with its compaction rewrites) is
+    # per-process, so multiple workers would serve inconsistent alert
+    # views and corrupt each other's journal.
+    #   gunicorn -w 1 -k gthread --threads 16 --timeout 120 \
+    #       'backend.api:create_app()'
+    port = int(os.environ.get('PORT', 5001))
+    create_app().run(host='0.0.0.0', port=port)
@@ -0,0 +1,92 @@
+"""Static configuration for the supported swap markets."""
+
+import sys
+import types
+from functools import lru_cache
+
+# Read-only views over tuples: callers share the config by reference
+# without being able to mutate it, which keeps the lru_cache'd lookups
+# below sound.
+_RAW_CONFIG = {
+    'AUD': {
+        'name': 'Australian Dollar',
+        'fixing_reference': 'BBSW',
+        'common_tenors': ('1Y', '2Y', '3Y', '4Y', '5Y', '7Y', '10Y',
+                          '15Y', '20Y', '30Y'),
+        'floating_conventions': ('3M', '6M'),
+        'day_count': 'ACT/365',
+        'payment_frequency': 'Semi-Annual',
+    },
+    'NZD': {
+        'name': 'New Zealand Dollar',
+        'fixing_reference': 'BKBM',
+        'common_tenors': ('1Y', '2Y', '3Y', '4Y', '5Y', '7Y', '10Y', '15Y'),
+        'floating_conventions': ('3M',),
+        'day_count': 'ACT/365',
+        'payment_frequency': 'Semi-Annual',
+    },
+}
+
+CURRENCY_CONFIG = types.MappingProxyType({
+    ccy: types.MappingProxyType(cfg) for ccy, cfg in _RAW_CONFIG.items()
+})
+
+SUPPORTED_CURRENCIES = tuple(CURRENCY_CONFIG.keys())
+
+# Partial evaluation of the static config: the hot labeling path only
+# ever needs the per-currency fixing name and the set of references
+# that mark a leg as already labeled, so both are built once at import.
+_FIXING_BY_CCY = {
+    ccy: cfg['fixing_reference'] for ccy, cfg in CURRENCY_CONFIG.items()
+}
+_KNOWN_REFS = frozenset({
+    'LIBOR', 'TIBOR', 'BBSW', 'SOFR', 'SONIA', '€STR', 'TONA', 'CORRA',
+    'EURIBOR', 'BKBM', 'CDOR',
+})
+
+
+@lru_cache(maxsize=None)
+def get_currency_info(currency):
+    return CURRENCY_CONFIG.get(currency.upper())
+
+
+@lru_cache(maxsize=None)
+def get_currency_name(currency):
+    config = CURRENCY_CONFIG.get(currency.upper())
+    return config['name'] if config else currency
+
+
+@lru_cache(maxsize=None)
+def get_currency_tenors(currency):
+    config = CURRENCY_CONFIG.get(currency.upper())
+    return config['common_tenors'] if config else []
+
+
+@lru_cache(maxsize=256)
+def get_fixing_reference(currency, floating_rate):
+    """Label a floating leg with the currency's fixing reference.
+
+    '6M' for AUD becomes '6M BBSW'; legs already carrying a recognised
+    reference are returned untouched.  The input domain is tiny (a few
+    dozen distinct strings), so the cache turns repeat calls into one
+    dict probe, and interned results make downstream equality checks
+    pointer comparisons.
+    """
+    fixing_ref = _FIXING_BY_CCY.get(currency)
+    if fixing_ref is None:
+        return sys.intern(floating_rate)
+    parts = floating_rate.split(None, 1)
+    if not parts:
+        return sys.intern(fixing_ref)
+    if len(parts) == 2 and parts[1] in _KNOWN_REFS:
+        return sys.intern(floating_rate)
+    return sys.intern(f"{parts[0]} {fixing_ref}")
+
+
+@lru_cache(maxsize=256)
+def parse_floating_rate(floating_rate):
+    """Split '3M BBSW' into ('3M', 'BBSW'); bare tenors get (tenor, None)."""
+    parts = floating_rate.split()
+    if len(parts) == 2:
+        return sys.intern(parts[0]), sys.intern(parts[1])
+    return sys.intern(floating_rate), None
@@ -0,0 +1,546 @@
+"""SQLAlchemy models and data access for the swap rates database."""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+from sqlalchemy import (Column, Date, DateTime, Float, Index, Integer,
+                        String, UniqueConstraint, and_, case, cast,
+                        create_engine, distinct, event, func, or_, select,
+                        text)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+Base = declarative_base()
+
+
+class SwapRate(Base):
+    """One observed swap rate.  ``rate`` is a decimal fraction (0.0425 = 4.25%)."""
+
+    __tablename__ = 'swap_rates'
+
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False, index=True)
+    currency = Column(String(3), nullable=False)
+    tenor = Column(String(8), nullable=False)
+    floating_rate = Column(String(16), nullable=False)
+    rate = Column(Float, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint('date', 'currency', 'tenor', 'floating_rate',
+                         name='unique_rate_entry'),
+        # Matches the dominant access pattern (filter by currency, then
+        # date range / sort, then tenor + floating leg); one composite
+        # beats three single-column indexes the planner can't combine.
+        Index('ix_swap_ccy_date_tenor_fr',
+              'currency', 'date', 'tenor', 'floating_rate'),
+        # Single-tenor history lookups (WHERE currency AND tenor
+        # ORDER BY date DESC LIMIT n) terminate after n index entries
+        # with tenor ahead of date; the index above can't, because a
+        # tenor filter there has to scan every date.
+        Index('ix_swap_ccy_tenor_date', 'currency', 'tenor', 'date'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'date': self.date.isoformat(),
+            'currency': self.currency,
+            'tenor': self.tenor,
+            'floating_rate': self.floating_rate,
+            'rate': self.rate,
+            'rate_percent': self.rate * 100,
+        }
+
+
+class BenchmarkRate(Base):
+    """Benchmark reference rates (cash rates, bank bills, ...)."""
+
+    __tablename__ = 'benchmark_rates'
+
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False, index=True)
+    currency = Column(String(3), nullable=False, index=True)
+    rate_type = Column(String(32), nullable=False)
+    rate = Column(Float, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('date', 'currency', 'rate_type',
+                         name='unique_benchmark_entry'),
+    )
+
+
+class OISRate(Base):
+    """Overnight index swap rates."""
+
+    __tablename__ = 'ois_rates'
+
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False, index=True)
+    currency = Column(String(3), nullable=False, index=True)
+    rate_type = Column(String(32), nullable=False)
+    rate = Column(Float, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('date', 'currency', 'rate_type',
+                         name='unique_ois_entry'),
+    )
+
+
+_TENOR_RE = re.compile(r'\d+')
+
+
+@lru_cache(maxsize=512)
+def tenor_sort_key(tenor):
+    """Sort key for tenor strings ('1M', '6M', '1Y', '10Y') in months.
+
+    Cached: the key is recomputed once per distinct tenor string rather
+    than once per result row, and tenor cardinality is tiny.
+    """
+    t = tenor.upper().strip()
+    try:
+        if t.endswith('M'):
+            return int(t[:-1])
+        if t.endswith('Y'):
+            return int(t[:-1]) * 12
+    except ValueError:
+        pass
+    match = _TENOR_RE.search(t)
+    if match:
+        return int(match.group())
+    return 9999
+
+
+# SQL twin of tenor_sort_key: months extracted from the tenor string so
+# curve queries can ORDER BY inside SQLite instead of sorting in Python.
+_TENOR_MONTHS_SQL = case(
+    (SwapRate.tenor.like('%M'),
+     cast(func.replace(SwapRate.tenor, 'M', ''), Integer)),
+    else_=cast(func.replace(SwapRate.tenor, 'Y', ''), Integer) * 12,
+).label('tenor_months')
+
+
+# Core column set for rate reads.  Rows come back as plain named tuples
+# (attribute access intact, ``row._mapping`` for dicts) without ORM
+# identity-map bookkeeping, the date already serialized in SQL and
+# ``rate_percent`` precomputed for presentation.
+_RATE_SELECT = (
+    SwapRate.id,
+    func.strftime('%Y-%m-%d', SwapRate.date).label('date'),
+    SwapRate.currency,
+    SwapRate.tenor,
+    SwapRate.floating_rate,
+    SwapRate.rate,
+    (SwapRate.rate * 100).label('rate_percent'),
+)
+
+
+# Raw SQL for the benchmark / OIS readers, assembled from constants so
+# each of the few possible statement shapes stays byte-identical across
+# calls and hits the driver's prepared-statement cache.  LIMIT is a
+# bound parameter for the same reason.
+_BENCHMARK_SQL = ("SELECT strftime('%Y-%m-%d', date) AS date, currency, "
+                  "rate_type, rate FROM benchmark_rates "
+                  "WHERE currency = :currency")
+_OIS_SQL = ("SELECT strftime('%Y-%m-%d', date) AS date, currency, "
+            "rate_type, rate FROM ois_rates "
+            "WHERE currency = :currency")
+_RATE_TYPE_CLAUSE = " AND rate_type = :rate_type"
+_ORDER_LIMIT_CLAUSE = " ORDER BY date DESC LIMIT :limit"
+_ORDER_CLAUSE = " ORDER BY date DESC"
+# Hard ceiling on LIMIT so a bad parameter can't trigger a huge scan.
+_MAX_LIMIT = 10000
+
+# All metadata lists for one currency in a single round-trip; each arm
+# deduplicates on its own and the constant key column routes rows back
+# to their bucket in Python.
+_METADATA_SQL = (
+    "SELECT DISTINCT 'date' AS k, strftime('%Y-%m-%d', date) AS v "
+    "FROM swap_rates WHERE currency = :currency "
+    "UNION ALL "
+    "SELECT DISTINCT 'tenor', tenor "
+    "FROM swap_rates WHERE currency = :currency "
+    "UNION ALL "
+    "SELECT DISTINCT 'floating_rate', floating_rate "
+    "FROM swap_rates WHERE currency = :currency")
+
+
+class DatabaseManager:
+    """Owns the SQLite engine and all swap-rate data access."""
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            db_dir = Path(__file__).parent.parent / 'database'
+            db_dir.mkdir(exist_ok=True)
+            db_path = db_dir / 'swap_rates.db'
+        self.engine = create_engine(f'sqlite:///{db_path}',
+                                    insertmanyvalues_page_size=1000,
+                                    poolclass=QueuePool,
+                                    pool_size=8, max_overflow=16,
+                                    pool_pre_ping=True,
+                                    connect_args={'check_same_thread': False,
+                                                  'timeout': 30})
+        event.listens_for(self.engine, 'connect')(self._on_connect)
+        Base.metadata.create_all(self.engine)
+        # Refresh planner statistics so the composite index gets picked.
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql('ANALYZE')
+        # Thread-local sessions over a shared pool; a single long-lived
+        # Session would serialize every query behind one connection.
+        self.Session = scoped_session(
+            sessionmaker(bind=self.engine, expire_on_commit=False))
+        # Data version straight from SQLite: PRAGMA data_version changes
+        # whenever any *other* connection commits — pool connections in
+        # this process and other processes writing the same file alike —
+        # so response caches keyed on it cannot go stale the way an
+        # in-process write counter can.  Polled on a dedicated
+        # connection that never writes.
+        self._version_conn = sqlite3.connect(str(db_path),
+                                             check_same_thread=False,
+                                             timeout=30)
+        self._version_lock = threading.Lock()
+        # Statements issued since startup; only counted in dev mode.
+        self.query_count = 0
+        if os.getenv('RATEEDGE_DEV'):
+            self._enable_query_profiling()
+
+    def _enable_query_profiling(self):
+        """Count and log every statement (dev only, RATEEDGE_DEV=1).
+
+        A loop accidentally calling add_rate per row shows up here as a
+        statement storm long before it shows up as a 400x slowdown in
+        production; tests can also assert on ``query_count`` (e.g. a
+        1000-row bulk_add_rates should emit only a handful of
+        statements).
+        """
+        @event.listens_for(self.engine, 'before_cursor_execute')
+        def _count(conn, cursor, statement, parameters, context,
+                   executemany):
+            self.query_count += 1
+            logger.debug('SQL #%d%s: %s', self.query_count,
+                         ' [executemany]' if executemany else '',
+                         statement)
+
+    @staticmethod
+    def _on_connect(dbapi_conn, connection_record):
+        """Tune each raw SQLite connection for write throughput.
+
+        WAL avoids writer/reader blocking and, with synchronous=NORMAL,
+        drops the fsync-per-commit that dominates bulk-import wall time.
+        """
+        cursor = dbapi_conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-65536')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.execute('PRAGMA busy_timeout=30000')
+        cursor.close()
+
+    @property
+    def version(self):
+        """Current data version, read from ``PRAGMA data_version``."""
+        with self._version_lock:
+            return self._version_conn.execute(
+                'PRAGMA data_version').fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # writes
+    # ------------------------------------------------------------------
+
+    def add_rate(self, date, currency, tenor, rate, floating_rate='6M'):
+        """Insert or update a single rate observation.
+
+        One native UPSERT against the ``unique_rate_entry`` index; no
+        prior SELECT, so the write is a single race-free round-trip.
+        """
+        stmt = sqlite_insert(SwapRate).values(
+            date=date, currency=currency, tenor=tenor,
+            floating_rate=floating_rate, rate=rate)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['date', 'currency', 'tenor', 'floating_rate'],
+            set_={'rate': stmt.excluded.rate,
+                  'updated_at': datetime.utcnow()},
+        )
+        with self.Session() as session:
+            session.execute(text('BEGIN IMMEDIATE'))
+            session.execute(stmt)
+            session.commit()
+
+    # Rows per multi-VALUES statement; keeps the bind-parameter count
+    # well under SQLite's limit.
+    _BULK_CHUNK = 1000
+    # Batches at least this big skip the Core statement machinery and go
+    # straight to the driver via executemany.
+    _FAST_PATH_MIN_ROWS = 10000
+    # After imports this big, fold the WAL back into the main database
+    # file so it doesn't keep growing across sessions.
+    _CHECKPOINT_MIN_ROWS = 50000
+
+    def _checkpoint_wal(self):
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    def bulk_upsert_fast(self, rows):
+        """Driver-level upsert for very large batches.
+
+        Takes normalized row dicts (as built by ``bulk_add_rates``) and
+        runs a single ``executemany`` upsert on the raw sqlite3
+        connection inside one explicit transaction — the SQLite
+        equivalent of a COPY fast path.
+        """
+        params = [(str(r['date']), r['currency'], r['tenor'],
+                   r['floating_rate'], r['rate'],
+                   str(r['created_at']), str(r['updated_at']))
+                  for r in rows]
+        raw = self.engine.raw_connection()
+        try:
+            dbapi_conn = raw.driver_connection
+            old_isolation = dbapi_conn.isolation_level
+            # Manual transaction control; the driver must not inject
+            # its own BEGIN around the executemany.
+            dbapi_conn.isolation_level = None
+            try:
+                cursor = dbapi_conn.cursor()
+                cursor.execute('BEGIN IMMEDIATE')
+                cursor.executemany(
+                    'INSERT INTO swap_rates'
+                    '(date, currency, tenor, floating_rate, rate,'
+                    ' created_at, updated_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?) '
+                    'ON CONFLICT(date, currency, tenor, floating_rate) '
+                    'DO UPDATE SET rate = excluded.rate,'
+                    ' updated_at = excluded.updated_at',
+                    params)
+                cursor.execute('COMMIT')
+                cursor.close()
+            finally:
+                dbapi_conn.isolation_level = old_isolation
+        finally:
+            raw.close()
+        if len(rows) >= self._CHECKPOINT_MIN_ROWS:
+            self._checkpoint_wal()
+        return len(rows)
+
+    def bulk_add_rates(self, rates_data):
+        """Insert or update a batch of rate dicts.  Returns the row count.
+
+        One native ON CONFLICT upsert per chunk inside a single
+        transaction, instead of a SELECT + INSERT/UPDATE + commit per
+        row.
+        """
+        now = datetime.utcnow()
+        rows = [{
+            'date': item['date'],
+            'currency': item['currency'],
+            'tenor': item['tenor'],
+            'floating_rate': item.get('floating_rate', '6M'),
+            'rate': item['rate'],
+            'created_at': now,
+            'updated_at': now,
+        } for item in rates_data]
+        if not rows:
+            return 0
+        if len(rows) >= self._FAST_PATH_MIN_ROWS:
+            return self.bulk_upsert_fast(rows)
+
+        with self.Session() as session:
+            # Writers grab the write lock up front so a pooled reader
+            # can't force a SQLITE_BUSY lock upgrade mid-transaction.
+            session.execute(text('BEGIN IMMEDIATE'))
+            for start in range(0, len(rows), self._BULK_CHUNK):
+                chunk = rows[start:start + self._BULK_CHUNK]
+                stmt = sqlite_insert(SwapRate).values(chunk)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['date', 'currency', 'tenor',
+                                    'floating_rate'],
+                    set_={'rate': stmt.excluded.rate, 'updated_at': now},
+                )
+                session.execute(stmt)
+            session.commit()
+        return len(rows)
+
+    def delete_rates(self, currency, start_date=None, end_date=None):
+        """Delete rates for a currency, optionally bounded by date."""
+        with self.Session() as session:
+            session.execute(text('BEGIN IMMEDIATE'))
+            query = session.query(SwapRate).filter(SwapRate.currency == currency)
+            if start_date:
+                query = query.filter(SwapRate.date >= start_date)
+            if end_date:
+                query = query.filter(SwapRate.date <= end_date)
+            # One DELETE; its rowcount replaces the separate COUNT query,
+            # and there are no loaded objects to synchronize.
+            count = query.delete(synchronize_session=False)
+            session.commit()
+        return count
+
+    # ------------------------------------------------------------------
+    # reads
+    # ------------------------------------------------------------------
+
+    def get_rates(self, currency, tenor=None, start_date=None, end_date=None):
+        """Rates for a currency (and optional tenor).
+
+        Invariant: rows come back in ascending date order; callers rely
+        on this instead of re-sorting (latest observation is ``[-1]``).
+        """
+        stmt = select(*_RATE_SELECT).where(SwapRate.currency == currency)
+        if tenor:
+            stmt = stmt.where(SwapRate.tenor == tenor)
+        if start_date:
+            stmt = stmt.where(SwapRate.date >= start_date)
+        if end_date:
+            stmt = stmt.where(SwapRate.date <= end_date)
+        stmt = stmt.order_by(SwapRate.date.asc())
+        with self.Session() as session:
+            return session.execute(stmt).all()
+
+    def get_rates_bulk(self, pairs, limit=None):
+        """Fetch rate history for many (currency, tenor) pairs in one query.
+
+        Returns ``{(currency, tenor): [SwapRate, ...]}`` newest first,
+        trimmed to ``limit`` rows per pair when given.
+        """
+        result = {pair: [] for pair in pairs}
+        if not pairs:
+            return result
+        clause = or_(*[
+            and_(SwapRate.currency == c, SwapRate.tenor == t) for c, t in pairs
+        ])
+        if limit is None:
+            stmt = (select(*_RATE_SELECT)
+                    .where(clause)
+                    .order_by(SwapRate.date.desc()))
+        else:
+            # The per-pair cap runs in SQL: rank rows newest-first
+            # within each pair and keep the top ``limit``, so a capped
+            # call reads that many rows per pair off the composite
+            # index instead of dragging each pair's whole history into
+            # Python to be trimmed.
+            ranked = (select(*_RATE_SELECT,
+                             func.row_number()
+                             .over(partition_by=(SwapRate.currency,
+                                                 SwapRate.tenor),
+                                   order_by=SwapRate.date.desc())
+                             .label('rn'))
+                      .where(clause)
+                      .subquery())
+            stmt = (select(*(ranked.c[col.key] for col in _RATE_SELECT))
+                    .where(ranked.c.rn <= limit)
+                    .order_by(ranked.c.date.desc()))
+        with self.Session() as session:
+            rows = session.execute(stmt).all()
+        for row in rows:
+            bucket = result.get((row.currency, row.tenor))
+            if bucket is not None and (limit is None or len(bucket) < limit):
+                bucket.append(row)
+        return result
+
+    def get_latest_rates(self, currency):
+        """Full curve for the most recent date, sorted by tenor.
+
+        One round-trip: the max date comes from a CTE joined against the
+        row filter, which the composite index answers with a single
+        seek, instead of a separate MAX() query followed by an equality
+        scan.
+        """
+        latest = (select(func.max(SwapRate.date).label('d'))
+                  .where(SwapRate.currency == currency)
+                  .cte('latest_date'))
+        stmt = (select(*_RATE_SELECT)
+                .join(latest, SwapRate.date == latest.c.d)
+                .where(SwapRate.currency == currency)
+                .order_by(_TENOR_MONTHS_SQL))
+        with self.Session() as session:
+            return session.execute(stmt).all()
+
+    def get_available_dates(self, currency=None):
+        stmt = select(distinct(func.strftime('%Y-%m-%d', SwapRate.date)))
+        if currency:
+            stmt = stmt.where(SwapRate.currency == currency)
+        with self.Session() as session:
+            return sorted(session.execute(stmt).scalars())
+
+    def get_available_tenors(self, currency):
+        stmt = (select(distinct(SwapRate.tenor))
+                .where(SwapRate.currency == currency))
+        with self.Session() as session:
+            tenors = session.execute(stmt).scalars().all()
+        return sorted(tenors, key=tenor_sort_key)
+
+    def get_available_floating_rates(self, currency):
+        stmt = (select(distinct(SwapRate.floating_rate))
+                .where(SwapRate.currency == currency))
+        with self.Session() as session:
+            return sorted(session.execute(stmt).scalars())
+
+    def get_metadata(self, currency):
+        """Dates, tenors and floating legs for a currency in one query.
+
+        The per-list getters cost a round-trip each; pages that need all
+        three should call this instead.
+        """
+        buckets = {'date': [], 'tenor': [], 'floating_rate': []}
+        with self.Session() as session:
+            for key, value in session.execute(text(_METADATA_SQL),
+                                              {'currency': currency}):
+                buckets[key].append(value)
+        return {
+            'dates': sorted(buckets['date']),
+            'tenors': sorted(buckets['tenor'], key=tenor_sort_key),
+            'floating_rates': sorted(buckets['floating_rate']),
+        }
+
+    # ------------------------------------------------------------------
+    # benchmark / OIS rates (raw SQL)
+    # ------------------------------------------------------------------
+
+    def get_benchmark_rates(self, currency, rate_type=None, limit=None):
+        return self._get_reference_rates(_BENCHMARK_SQL, currency,
+                                         rate_type, limit)
+
+    def _get_reference_rates(self, base_sql, currency, rate_type, limit):
+        query = base_sql
+        params = {'currency': currency}
+        if rate_type:
+            query += _RATE_TYPE_CLAUSE
+            params['rate_type'] = rate_type
+        if limit:
+            query += _ORDER_LIMIT_CLAUSE
+            params['limit'] = min(int(limit), _MAX_LIMIT)
+        else:
+            query += _ORDER_CLAUSE
+        with self.Session() as session:
+            rows = session.execute(text(query), params)
+            return [dict(row._mapping) for row in rows]
+
+    def get_benchmark_rate_types(self, currency):
+        with self.Session() as session:
+            rows = session.execute(
+                text("SELECT DISTINCT rate_type FROM benchmark_rates "
+                     "WHERE currency = :currency ORDER BY rate_type"),
+                {'currency': currency})
+            return [row[0] for row in rows]
+
+    def get_ois_rates(self, currency, rate_type=None, limit=None):
+        return self._get_reference_rates(_OIS_SQL, currency, rate_type, limit)
+
+    def get_ois_rate_types(self, currency):
+        with self.Session() as session:
+            rows = session.execute(
+                text("SELECT DISTINCT rate_type FROM ois_rates "
+                     "WHERE currency = :currency ORDER BY rate_type"),
+                {'currency': currency})
+            return [row[0] for row in rows]
@@ -0,0 +1,179 @@
+"""PDF market reports for stored swap curves (ReportLab + matplotlib)."""
+
+import hashlib
+import threading
+from pathlib import Path
+
+import numpy as np
+# The OO API with an explicit Agg canvas sidesteps pyplot's global
+# figure registry and GUI backend probing entirely.
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from reportlab.graphics.charts.lineplots import LinePlot
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.widgets.markers import makeMarker
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.platypus import (Image, Paragraph, SimpleDocTemplate, Spacer,
+                                Table, TableStyle)
+
+from .currency_config import get_currency_name
+
+# Tenors that get a historical section in the market report.
+_KEY_TENORS = ('2Y', '5Y', '10Y')
+
+_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f3864')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+    ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white,
+                                          colors.HexColor('#eef2f8')]),
+])
+
+
+class SwapRateReportGenerator:
+    """Builds the per-currency market report PDF."""
+
+    def __init__(self, db_manager, cache_dir=None):
+        self.db_manager = db_manager
+        if cache_dir is None:
+            cache_dir = (Path(__file__).resolve().parent.parent
+                         / 'database' / 'chart_cache')
+        # Rendered chart PNGs, keyed on the inputs that determine their
+        # pixels.  Re-generating a report for unchanged data skips
+        # matplotlib entirely and embeds the file by path.
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.styles = getSampleStyleSheet()
+        # One Figure reused for every chart; creating and tearing down a
+        # figure per chart dominates matplotlib cost for small plots.
+        # The lock serializes access since a shared Axes isn't
+        # reentrant.
+        self._fig = Figure(figsize=(6, 4))
+        FigureCanvasAgg(self._fig)
+        self._ax = self._fig.add_subplot()
+        self._fig_lock = threading.Lock()
+
+    def generate_market_report(self, currency, output_path, days=90):
+        """Write the market report PDF; returns the output path."""
+        doc = SimpleDocTemplate(str(output_path), pagesize=A4,
+                                title=f'{currency} Swap Rates')
+        # The story arrives as a generator so each section's rows and
+        # intermediate chart state become collectable as soon as it is
+        # yielded; only the lightweight flowables survive into the
+        # build.  Chart pixels stay on disk in the cache — the Image
+        # flowables carry a path, not bytes.
+        doc.build(list(self._iter_story(currency, days)))
+        return output_path
+
+    def _iter_story(self, currency, days):
+        """Yield the report's flowables one section at a time."""
+        # Prefetch everything the sections need in two queries: the
+        # latest curve (shared by the table and the curve chart) and one
+        # bulk history fetch covering every key tenor, instead of one
+        # round-trip per section.
+        latest = self.db_manager.get_latest_rates(currency)
+        history = self.db_manager.get_rates_bulk(
+            [(currency, tenor) for tenor in _KEY_TENORS], limit=days)
+
+        yield Paragraph(f'{get_currency_name(currency)} Swap Rates',
+                        self.styles['Title'])
+        yield Spacer(1, 0.4 * cm)
+
+        table = self._create_latest_rates_table(latest)
+        if table is not None:
+            yield Paragraph('Latest Curve', self.styles['Heading2'])
+            yield table
+            yield Spacer(1, 0.4 * cm)
+
+        chart = self._create_yield_curve_chart(currency, latest)
+        if chart is not None:
+            yield chart
+            yield Spacer(1, 0.4 * cm)
+
+        for tenor in _KEY_TENORS:
+            # get_rates_bulk returns newest first; charts want ascending.
+            rows = history.get((currency, tenor), [])[::-1]
+            chart = self._create_historical_chart(currency, tenor, rows)
+            if chart is None:
+                continue
+            yield Paragraph(f'{tenor} History', self.styles['Heading2'])
+            yield chart
+            yield Spacer(1, 0.4 * cm)
+
+    # ------------------------------------------------------------------
+    # building blocks
+    # ------------------------------------------------------------------
+
+    def _chart_cache_path(self, *parts):
+        key = hashlib.md5('|'.join(str(p) for p in parts).encode()).hexdigest()
+        return self.cache_dir / f'{key}.png'
+
+    def _create_latest_rates_table(self, rows):
+        if not rows:
+            return None
+        data = [['Tenor', 'Rate (%)', 'Floating Leg']]
+        data += [[r.tenor, f'{r.rate_percent:.3f}', r.floating_rate]
+                 for r in rows]
+        table = Table(data, colWidths=[3 * cm, 3 * cm, 4 * cm])
+        table.setStyle(_TABLE_STYLE)
+        return table
+
+    def _create_yield_curve_chart(self, currency, rows):
+        """Vector yield-curve chart built straight from ReportLab shapes.
+
+        The curve is a handful of points, so drawing it with the
+        graphics framework skips matplotlib's rasterizer entirely and
+        embeds resolution-independent vectors a few hundred bytes long
+        instead of a 150-dpi PNG.
+        """
+        if not rows:
+            return None
+        tenors = [r.tenor for r in rows]
+        drawing = Drawing(400, 230)
+        plot = LinePlot()
+        plot.x, plot.y, plot.width, plot.height = 40, 30, 340, 165
+        plot.data = [[(float(i), float(r.rate_percent))
+                      for i, r in enumerate(rows)]]
+        plot.lines[0].strokeColor = colors.HexColor('#1f3864')
+        plot.lines[0].strokeWidth = 1.5
+        plot.lines[0].symbol = makeMarker('FilledCircle')
+        plot.xValueAxis.valueMin = 0
+        plot.xValueAxis.valueMax = len(rows) - 1
+        plot.xValueAxis.valueSteps = list(range(len(rows)))
+        plot.xValueAxis.labelTextFormat = lambda v: tenors[int(v)]
+        plot.yValueAxis.labelTextFormat = '%0.2f'
+        drawing.add(plot)
+        drawing.add(String(200, 212,
+                           f'{currency} Yield Curve ({rows[0].date})',
+                           textAnchor='middle', fontName='Helvetica-Bold',
+                           fontSize=11))
+        return drawing
+
+    def _create_historical_chart(self, currency, tenor, rates):
+        if len(rates) < 2:
+            return None
+        png = self._chart_cache_path('hist', currency, tenor, len(rates),
+                                     rates[-1].date)
+        if not png.exists():
+            dates = np.array([r.date for r in rates], dtype='datetime64[D]')
+            values = np.array([r.rate_percent for r in rates])
+            with self._fig_lock:
+                ax = self._ax
+                ax.clear()
+                ax.plot(dates, values, color='#1f3864')
+                ax.set_ylabel('Rate (%)')
+                ax.set_title(f'{currency} {tenor} — '
+                             f'last {len(rates)} fixings')
+                ax.grid(True, alpha=0.3)
+                self._fig.autofmt_xdate()
+                self._fig.savefig(png, dpi=100, format='png',
+                                  bbox_inches='tight')
+        # lazy=2 re-opens the file per draw and releases the decoded
+        # pixels afterwards, instead of holding every chart's bytes
+        # until the document closes.
+        return Image(str(png), width=14 * cm, height=9 * cm, lazy=2)
@@ -0,0 +1,270 @@
+"""Forward-starting swap pricing off zero curves.
+
+Curves are plain dicts mapping tenor in months to a continuously
+compounded zero rate as a decimal fraction, e.g. ``{12: 0.041, 60:
+0.0425}``.
+"""
+
+import math
+from datetime import date
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+from numba import njit
+
+
+@njit(cache=True)
+def _interp_zero(tenors, rates, tenor_months):
+    """Linear interpolation on a sorted curve, flat beyond the ends."""
+    idx = np.searchsorted(tenors, tenor_months)
+    if idx == 0:
+        return rates[0]
+    if idx == tenors.shape[0]:
+        return rates[-1]
+    lo = tenors[idx - 1]
+    hi = tenors[idx]
+    w = (tenor_months - lo) / (hi - lo)
+    return rates[idx - 1] + w * (rates[idx] - rates[idx - 1])
+
+
+@njit(cache=True)
+def _interp_zero_many(tenors, rates, points):
+    """Vectorized ``_interp_zero`` over an array of tenor points."""
+    out = np.empty(points.shape[0])
+    for i in range(points.shape[0]):
+        out[i] = _interp_zero(tenors, rates, points[i])
+    return out
+
+
+@njit(cache=True)
+def _price_legs(times_start, times_end, year_fracs, z_start, z_end, disc_z,
+                notional, fixed_rate, spread):
+    """Forward rates, discount factors and PVs for both legs at once.
+
+    Works off zero rates interpolated up front, so the per-cashflow
+    loop is pure arithmetic; the discount factors are computed once and
+    shared, since both legs pay on the same dates off the same curve.
+    The par-rate annuity accumulates inside the same loop, saving a
+    second pass over the arrays.
+    """
+    n = times_end.shape[0]
+    float_fwds = np.empty(n)
+    dfs = np.empty(n)
+    fixed_pvs = np.empty(n)
+    float_pvs = np.empty(n)
+    annuity = 0.0
+    for i in range(n):
+        t_s = times_start[i]
+        t_e = times_end[i]
+        yf = year_fracs[i]
+        fwd = (z_end[i] * t_e - z_start[i] * t_s) / (t_e - t_s) + spread
+        df = math.exp(-disc_z[i] * t_e)
+        float_fwds[i] = fwd
+        dfs[i] = df
+        fixed_pvs[i] = notional * fixed_rate * yf * df
+        float_pvs[i] = notional * fwd * yf * df
+        annuity += yf * df
+    return float_fwds, dfs, fixed_pvs, float_pvs, annuity
+
+
+try:
+    # Optional AOT build of the kernels above (see _swap_kernels_aot);
+    # when the compiled module is shipped there is no JIT warmup on the
+    # first priced swap.
+    from . import swap_kernels as _aot
+except ImportError:
+    _aot = None
+
+
+def _interp_many(tenors, rates, points):
+    if _aot is not None:
+        out = np.empty_like(points)
+        _aot.interp_zero_many(tenors, rates, points, out)
+        return out
+    return _interp_zero_many(tenors, rates, points)
+
+
+def _run_price_legs(times_start, times_end, year_fracs, z_start, z_end,
+                    disc_z, notional, fixed_rate, spread):
+    if _aot is not None:
+        n = times_end.shape[0]
+        float_fwds = np.empty(n)
+        dfs = np.empty(n)
+        fixed_pvs = np.empty(n)
+        float_pvs = np.empty(n)
+        annuity = _aot.price_legs(times_start, times_end, year_fracs,
+                                  z_start, z_end, disc_z, notional,
+                                  fixed_rate, spread, float_fwds, dfs,
+                                  fixed_pvs, float_pvs)
+        return float_fwds, dfs, fixed_pvs, float_pvs, annuity
+    return _price_legs(times_start, times_end, year_fracs, z_start, z_end,
+                       disc_z, notional, fixed_rate, spread)
+
+
+# Sorted-array form of every curve seen so far, shared across pricer
+# instances and keyed on the curve's contents.  A book repricing uses
+# the same handful of canonical curves (OIS, BBSW projection), so the
+# sort and array build happen once per distinct curve interpreter-wide.
+# The content key also makes in-place curve mutation (bump-and-reprice)
+# safe: a changed value is simply a different key.
+_CURVE_ARRAY_CACHE = {}
+_CURVE_CACHE_MAX = 128
+
+
+def _curve_arrays(curve):
+    """Sorted (tenors, rates) float64 arrays from a curve dict."""
+    key = tuple(sorted(curve.items()))
+    cached = _CURVE_ARRAY_CACHE.get(key)
+    if cached is None:
+        if len(_CURVE_ARRAY_CACHE) >= _CURVE_CACHE_MAX:
+            # FIFO eviction keeps the bound without LRU bookkeeping;
+            # insertion order is the dict's natural order.
+            _CURVE_ARRAY_CACHE.pop(next(iter(_CURVE_ARRAY_CACHE)))
+        tenors = np.array([t for t, _ in key], dtype=np.float64)
+        rates = np.array([r for _, r in key], dtype=np.float64)
+        cached = _CURVE_ARRAY_CACHE[key] = (tenors, rates)
+    return cached
+
+
+class SwapPricer:
+    """Prices forward-starting fixed-for-floating swaps."""
+
+    DAY_COUNT_BASE = 365.0
+
+    # Compounding names resolve once to an int code: 0 is continuous,
+    # anything else is the periods-per-year count, which makes the
+    # discounting body branchless arithmetic.
+    _COMPOUND_CODES = {'continuous': 0, 'annual': 1, 'semi-annual': 2,
+                       'quarterly': 4}
+
+    def generate_schedule(self, start_date, maturity_years, frequency=2):
+        """Payment dates from start to maturity, ``frequency`` per year.
+
+        The period count follows directly from the inputs, so there is
+        no roll-forward loop; for start days that exist in every month
+        the dates come from one vectorized datetime64[M] addition, with
+        relativedelta kept only for the month-end edge cases.
+        """
+        months_per_period = 12 // frequency
+        offsets = np.arange(1, maturity_years * frequency + 1,
+                            dtype=np.int64) * months_per_period
+        if start_date.day <= 28:
+            months = (np.datetime64(start_date, 'M')
+                      + offsets.astype('timedelta64[M]'))
+            days = months.astype('datetime64[D]') + (start_date.day - 1)
+            return days.astype('O').tolist()
+        return [start_date + relativedelta(months=int(m)) for m in offsets]
+
+    def year_fraction(self, start, end):
+        """ACT/365 year fraction between two dates.
+
+        Public convenience only; ``price_forward_swap`` computes its
+        day counts in whole-array datetime64 arithmetic and never calls
+        this per cashflow.
+        """
+        return (end - start).days / self.DAY_COUNT_BASE
+
+    def interpolate_zero_rate(self, zero_curve, tenor_months):
+        """Zero rate at ``tenor_months``, linearly interpolated.
+
+        A bisect on the cached sorted arrays; no per-call sort or
+        bracket scan over the dict keys.
+        """
+        tenors, rates = _curve_arrays(zero_curve)
+        idx = np.searchsorted(tenors, tenor_months)
+        if idx == 0:
+            return float(rates[0])
+        if idx == tenors.shape[0]:
+            return float(rates[-1])
+        lo = tenors[idx - 1]
+        hi = tenors[idx]
+        w = (tenor_months - lo) / (hi - lo)
+        return float(rates[idx - 1] + w * (rates[idx] - rates[idx - 1]))
+
+    def discount_factor(self, rate, time, compounding='continuous'):
+        """Discount factor for a zero rate over ``time`` years.
+
+        ``compounding`` is a name from ``_COMPOUND_CODES`` or the int
+        code itself; callers discounting in a loop should translate the
+        name once and pass the code.
+        """
+        if not isinstance(compounding, int):
+            try:
+                compounding = self._COMPOUND_CODES[compounding]
+            except KeyError:
+                raise ValueError(
+                    f'unknown compounding: {compounding}') from None
+        if compounding == 0:
+            return math.exp(-rate * time)
+        return (1.0 + rate / compounding) ** (-compounding * time)
+
+    def price_forward_swap(self, notional, fixed_rate, start_date,
+                           maturity_years, projection_curve, discount_curve,
+                           valuation_date=None, frequency=2, spread=0.0,
+                           return_details=False):
+        """PV a payer swap (receive float, pay fixed).
+
+        Returns a dict with leg PVs, the NPV, the par rate, and — only
+        when ``return_details`` is set — one dict per cashflow.
+        """
+        if valuation_date is None:
+            valuation_date = date.today()
+
+        schedule = self.generate_schedule(start_date, maturity_years,
+                                          frequency)
+        if not schedule:
+            return None
+
+        # SoA construction: all day counts in three whole-array ops
+        # instead of three year_fraction calls per cashflow.
+        n = len(schedule)
+        pay = np.array(schedule, dtype='datetime64[D]')
+        prev = np.concatenate((np.array([start_date], dtype='datetime64[D]'),
+                               pay[:-1]))
+        val = np.datetime64(valuation_date, 'D')
+        times_start = (prev - val).astype(np.float64) / self.DAY_COUNT_BASE
+        times_end = (pay - val).astype(np.float64) / self.DAY_COUNT_BASE
+        year_fracs = (pay - prev).astype(np.float64) / self.DAY_COUNT_BASE
+
+        proj_tenors, proj_rates = _curve_arrays(projection_curve)
+        disc_tenors, disc_rates = _curve_arrays(discount_curve)
+
+        # Period ends are the next period's starts, so interpolating the
+        # deduplicated union of both point sets nearly halves the
+        # projection-curve bisects; each cashflow then indexes back into
+        # the unique results.
+        proj_points = np.unique(np.concatenate((times_start, times_end))
+                                * 12.0)
+        proj_z = _interp_many(proj_tenors, proj_rates, proj_points)
+        z_start = proj_z[np.searchsorted(proj_points, times_start * 12.0)]
+        z_end = proj_z[np.searchsorted(proj_points, times_end * 12.0)]
+        disc_z = _interp_many(disc_tenors, disc_rates, times_end * 12.0)
+
+        float_fwds, dfs, fixed_pvs, float_pvs, annuity = _run_price_legs(
+            times_start, times_end, year_fracs, z_start, z_end, disc_z,
+            notional, fixed_rate, spread)
+
+        fixed_pv = fixed_pvs.sum()
+        float_pv = float_pvs.sum()
+
+        result = {
+            'notional': notional,
+            'fixed_rate': fixed_rate,
+            'fixed_leg_pv': float(fixed_pv),
+            'float_leg_pv': float(float_pv),
+            'npv': float(float_pv - fixed_pv),
+            'par_rate': float(float_pv / (notional * annuity))
+            if annuity else None,
+        }
+        if return_details:
+            # Only PV-less callers pay for the dict-per-cashflow build;
+            # plain floats keep the rows stdlib-json serializable.
+            result['cashflows'] = [{
+                'payment_date': schedule[i].isoformat(),
+                'year_fraction': float(year_fracs[i]),
+                'forward_rate': float(float_fwds[i]),
+                'discount_factor': float(dfs[i]),
+                'fixed_pv': float(fixed_pvs[i]),
+                'float_pv': float(float_pvs[i]),
+            } for i in range(n)]
+        return result
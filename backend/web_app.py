@@ -0,0 +1,478 @@
+"""Dashboard web app: the rate browser UI and its JSON endpoints.
+
+Runs alongside the REST API in ``api`` as the human-facing entry
+point.  The heavy list endpoints (``/api/rates``, ``/api/latest``)
+fetch plain Core row tuples and serialize them with orjson; the rest
+of the routes are simple ORM-and-jsonify handlers.
+"""
+
+import io
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import wraps
+from pathlib import Path
+from uuid import uuid4
+
+import orjson
+import pandas as pd
+from cachetools import TTLCache
+from jinja2 import FileSystemBytecodeCache
+from flask import (Flask, Response, jsonify, render_template, request,
+                   send_file)
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+from sqlalchemy import bindparam, func, select
+
+from .database_models import DatabaseManager, SwapRate, tenor_sort_key
+from .excel_importer import ExcelImporter
+from .swap_pricer import SwapPricer
+
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+class _ORJSONProvider(DefaultJSONProvider):
+    """Route jsonify through orjson.
+
+    Several times faster than the stdlib encoder on numeric payloads,
+    and dates and numpy scalars encode natively — no per-row isoformat
+    or float() coercion needed by callers.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app = Flask(__name__)
+app.json = _ORJSONProvider(app)
+
+# The big list endpoints repeat currencies/tenors thousands of times
+# and compress ~10x, so on any real link they are bandwidth-bound
+# without this.  Level 4 keeps the CPU cost low; tiny responses are
+# left alone.
+app.config.update(COMPRESS_MIN_SIZE=1024, COMPRESS_LEVEL=4,
+                  COMPRESS_ALGORITHM=['br', 'gzip'])
+Compress(app)
+
+# Compiled templates persist across workers and restarts; without the
+# bytecode cache every fresh process re-parses and re-compiles each
+# template on its first render.  auto_reload off also drops the
+# per-request mtime stat (template edits then need a restart, which is
+# fine outside debug).
+_JINJA_CACHE_DIR = Path(tempfile.gettempdir()) / 'rateedge_jinja_cache'
+_JINJA_CACHE_DIR.mkdir(exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(
+    str(_JINJA_CACHE_DIR))
+app.jinja_env.auto_reload = False
+
+_DB_PATH = (Path(__file__).resolve().parent.parent
+            / 'database' / 'swap_rates.db')
+_DB_PATH.parent.mkdir(exist_ok=True)
+
+# Long-lived collaborators built once at startup; handler-local imports
+# and per-request construction paid an import-lock acquisition plus (for
+# the importer) a whole new connection pool on every call.
+db_manager = DatabaseManager(_DB_PATH)
+importer = ExcelImporter(db_manager)
+pricer = SwapPricer()
+
+# One engine for the whole module: the Core handlers check connections
+# out of the DatabaseManager's QueuePool, which already creates the
+# tables, runs ANALYZE, and applies the WAL/read-tuning pragmas per
+# connection.  The module previously built a second, identically
+# configured engine against the same file — a duplicate pool, duplicate
+# create_all and duplicate pragma listener for nothing.
+engine = db_manager.engine
+
+# rate_percent rides along from SQLite's numeric engine; the column is
+# already Float, so rows arrive as native floats with no per-row
+# multiplication left in Python.
+_RATE_COLUMNS = (SwapRate.date, SwapRate.currency, SwapRate.tenor,
+                 SwapRate.floating_rate, SwapRate.rate,
+                 (SwapRate.rate * 100).label('rate_percent'))
+
+# Statements for the hot endpoints built once at import; handlers bind
+# parameters at execute time instead of reconstructing (and re-hashing
+# into the compiled-SQL cache) the same expression tree per request.
+# SQLite treats LIMIT -1 as "no limit", so one statement shape covers
+# both the bounded and unbounded /api/rates calls.
+_RATES_STMT = (select(*_RATE_COLUMNS)
+               .where(SwapRate.currency == bindparam('currency'))
+               .order_by(SwapRate.date.desc())
+               .limit(bindparam('limit')))
+_RATES_TENOR_STMT = (select(*_RATE_COLUMNS)
+                     .where(SwapRate.currency == bindparam('currency'),
+                            SwapRate.tenor == bindparam('tenor'))
+                     .order_by(SwapRate.date.desc())
+                     .limit(bindparam('limit')))
+_TENORS_STMT = (select(SwapRate.tenor).distinct()
+                .where(SwapRate.currency == bindparam('currency')))
+# Latest row per tenor in one pass: rank rows newest-first within each
+# tenor and keep rank 1.  SQLite walks ix_swap_ccy_tenor_date once for
+# the whole answer, where the old shape ran a DISTINCT-tenors query
+# plus one LIMIT 1 query per tenor (N+1 round trips through the pool,
+# the statement cache and the parser).
+_latest_ranked = (select(*_RATE_COLUMNS,
+                         func.row_number()
+                         .over(partition_by=SwapRate.tenor,
+                               order_by=SwapRate.date.desc())
+                         .label('rn'))
+                  .where(SwapRate.currency == bindparam('currency'))
+                  .subquery())
+_LATEST_STMT = (select(_latest_ranked.c.date, _latest_ranked.c.currency,
+                       _latest_ranked.c.tenor,
+                       _latest_ranked.c.floating_rate,
+                       _latest_ranked.c.rate,
+                       _latest_ranked.c.rate_percent)
+                .where(_latest_ranked.c.rn == 1))
+_CURRENCIES_STMT = select(SwapRate.currency).distinct()
+# The full-table dump omits the presentation-only rate_percent column.
+_DATA_STMT = select(*_RATE_COLUMNS[:-1]).order_by(SwapRate.date)
+_STATS_STMT = (select(SwapRate.currency, func.count(SwapRate.id),
+                      func.min(SwapRate.date), func.max(SwapRate.date))
+               .group_by(SwapRate.currency))
+
+# Serialized bodies of the slow-moving metadata endpoints, keyed by
+# request path.  Sixty seconds bounds staleness between imports, and a
+# successful /api/import clears the cache outright.
+_meta_cache = TTLCache(maxsize=128, ttl=60)
+_meta_lock = threading.Lock()
+
+# Rendered download-format bodies of /api/rates, keyed by the query
+# parameters.  Export tools tend to re-pull the same slice; the bytes
+# are built once per minute per slice instead of per request.
+_export_cache = TTLCache(maxsize=32, ttl=60)
+_export_lock = threading.Lock()
+
+# Uploads above this spill to a temp file instead of a BytesIO.
+_SPILL_MIN_BYTES = 64 * 1024 * 1024
+
+# Reusable copy buffer for the spill path: one read and one write
+# syscall per 2 MiB, against copyfileobj's 80 KB hops — a ~25x cut in
+# syscalls per byte on multi-GB sheets — with no per-chunk bytes
+# allocation, since the stream reads straight into the same buffer.
+_SPILL_BUF_BYTES = 2 * 1024 * 1024
+
+
+def _spill_upload(stream, path):
+    """Copy an upload stream to ``path`` through one reusable buffer."""
+    buf = bytearray(_SPILL_BUF_BYTES)
+    view = memoryview(buf)
+    readinto = getattr(stream, 'readinto', None)
+    fd = os.open(path, os.O_WRONLY | os.O_TRUNC)
+    try:
+        while True:
+            if readinto is not None:
+                n = readinto(buf)
+            else:
+                chunk = stream.read(_SPILL_BUF_BYTES)
+                n = len(chunk)
+                view[:n] = chunk
+            if not n:
+                break
+            off = 0
+            while off < n:
+                off += os.write(fd, view[off:n])
+    finally:
+        os.close(fd)
+
+# Imports run on one background thread: a multi-GB sheet no longer
+# holds an HTTP thread for minutes, and a single worker serializes the
+# writers so imports never contend with each other for the SQLite
+# write lock.  Futures are kept by job id for the polling endpoint;
+# finished ones are pruned once the table grows past a small bound.
+_IMPORT_POOL = ThreadPoolExecutor(max_workers=1,
+                                  thread_name_prefix='import')
+_import_jobs = {}
+_import_jobs_lock = threading.Lock()
+_IMPORT_JOBS_MAX = 64
+
+
+def _submit_import(fn, *args):
+    """Queue an import, returning the job id for status polling."""
+    job_id = uuid4().hex
+    future = _IMPORT_POOL.submit(fn, *args)
+    with _import_jobs_lock:
+        if len(_import_jobs) >= _IMPORT_JOBS_MAX:
+            for key in [k for k, f in _import_jobs.items() if f.done()]:
+                del _import_jobs[key]
+        _import_jobs[job_id] = future
+    return job_id
+
+
+def _meta_cached(view):
+    """Serve ``view``'s JSON body from the TTL cache when fresh."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.path
+        with _meta_lock:
+            body = _meta_cache.get(key)
+        if body is None:
+            body = view(*args, **kwargs).get_data()
+            with _meta_lock:
+                _meta_cache[key] = body
+        return Response(body, mimetype='application/json')
+    return wrapper
+
+
+def _rates_response(rows):
+    """Serialize Core row tuples straight through orjson.
+
+    orjson handles ``date`` and ``float`` natively, so there is no
+    per-row isoformat/float coercion and no detour through the ORM or
+    Flask's stdlib-json provider.
+    """
+    data = [{'date': d, 'currency': c, 'tenor': t, 'floating_rate': fr,
+             'rate': r, 'rate_percent': rp}
+            for d, c, t, fr, r, rp in rows]
+    return Response(
+        orjson.dumps({'success': True, 'count': len(data), 'data': data}),
+        mimetype='application/json')
+
+
+def _stream_rates(stmt, params=None):
+    """Stream a rates SELECT as one JSON array, 1000 rows at a time.
+
+    Buffering a big result means three full copies in RAM (the row
+    list, the dict list, then the orjson buffer) before the first byte
+    goes out.  A server-side cursor plus chunked orjson encoding keeps
+    peak memory at one partition and starts the response immediately;
+    the envelope carries no count, which isn't known until the cursor
+    is drained.
+    """
+    def generate():
+        with engine.connect() as conn:
+            result = conn.execution_options(
+                stream_results=True).execute(stmt, params)
+            yield b'{"success":true,"data":['
+            first = True
+            for chunk in result.partitions(1000):
+                if not first:
+                    yield b','
+                first = False
+                yield b','.join(orjson.dumps(dict(row._mapping))
+                                for row in chunk)
+            yield b']}'
+
+    return Response(generate(), mimetype='application/json')
+
+
+@app.route('/')
+def index():
+    return render_template('index.html')
+
+
+# The liveness payload never changes; serialize it once so probes
+# hitting this every second cost a Response construction and nothing
+# else.
+_HEALTH_BODY = orjson.dumps({'status': 'healthy',
+                             'service': 'RateEdge Dashboard',
+                             'version': '1.0'})
+
+
+@app.route('/api/health')
+def health():
+    return Response(_HEALTH_BODY, mimetype='application/json')
+
+
+@app.route('/api/rates')
+def get_rates():
+    currency = request.args.get('currency', 'AUD').upper()
+    tenor = request.args.get('tenor')
+    # LIMIT in SQL lets the index scan stop after `limit` rows instead
+    # of dragging every match into Python to be sliced; -1 is SQLite's
+    # spelling of "no limit", so the prepared statement covers both.
+    limit = request.args.get('limit', type=int) or -1
+    params = {'currency': currency, 'limit': limit}
+    if tenor:
+        stmt = _RATES_TENOR_STMT
+        params['tenor'] = tenor.upper()
+    else:
+        stmt = _RATES_STMT
+    if request.args.get('format') == 'csv':
+        return _rates_export(stmt, params)
+    return _stream_rates(stmt, params)
+
+
+def _rates_export(stmt, params):
+    """Serve a rates slice as a cached CSV download.
+
+    Download-style pulls pay per-row JSON encoding plus compression on
+    every request; here the slice goes dataframe -> C-level to_csv once,
+    the bytes are cached for a minute keyed by the query parameters,
+    and Cache-Control lets clients and any proxy reuse them too.
+    """
+    key = tuple(sorted(params.items()))
+    with _export_lock:
+        body = _export_cache.get(key)
+    if body is None:
+        with engine.connect() as conn:
+            df = pd.read_sql(stmt, conn, params=params)
+        body = df.to_csv(index=False).encode()
+        with _export_lock:
+            _export_cache[key] = body
+    response = send_file(io.BytesIO(body), mimetype='text/csv',
+                         as_attachment=True, download_name='rates.csv')
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
+
+
+@app.route('/api/latest/<currency>')
+def get_latest(currency):
+    with engine.connect() as conn:
+        rows = conn.execute(
+            _LATEST_STMT, {'currency': currency.upper()}).all()
+    # Curve order is tenor months, not the lexicographic string order
+    # ('10Y' before '2Y') SQL would give; a handful of rows sorts for
+    # nothing in Python.
+    rows.sort(key=lambda row: tenor_sort_key(row.tenor))
+    return _rates_response(rows)
+
+
+@app.route('/api/statistics')
+@_meta_cached
+def statistics():
+    # One grouped scan yields the per-currency counts and date bounds;
+    # the totals and global min/max fold out of it in Python, instead
+    # of four separate SELECTs each walking the index.
+    with engine.connect() as conn:
+        groups = conn.execute(_STATS_STMT).all()
+    return jsonify({'success': True, 'data': {
+        'total_rates': sum(count for _, count, _, _ in groups),
+        'by_currency': {ccy: count for ccy, count, _, _ in groups},
+        'first_date': min((d for _, _, d, _ in groups), default=None),
+        'last_date': max((d for _, _, _, d in groups), default=None),
+    }})
+
+
+@app.route('/api/currencies')
+@_meta_cached
+def get_currencies():
+    with engine.connect() as conn:
+        currencies = conn.execute(_CURRENCIES_STMT).scalars().all()
+    return jsonify({'success': True, 'data': sorted(currencies)})
+
+
+@app.route('/api/tenors/<currency>')
+@_meta_cached
+def get_tenors(currency):
+    with engine.connect() as conn:
+        tenors = conn.execute(
+            _TENORS_STMT, {'currency': currency.upper()}).scalars().all()
+    return jsonify({'success': True,
+                    'data': sorted(tenors, key=tenor_sort_key)})
+
+
+@app.route('/api/data')
+def get_data():
+    """Stream the full table as one JSON array (no rate_percent)."""
+    return _stream_rates(_DATA_STMT)
+
+
+def _run_import(source, currency, unlink_path=None):
+    """Background body of an import job; returns the row count."""
+    # The importer feeds DatabaseManager.bulk_add_rates, which upserts
+    # in chunked executemany batches inside one transaction (and a
+    # raw-cursor fast path for 10k+ rows) — no per-row ORM adds
+    # anywhere on this path.
+    try:
+        count = importer.import_from_excel(source, currency=currency)
+    finally:
+        if unlink_path is not None:
+            os.unlink(unlink_path)
+    with _meta_lock:
+        _meta_cache.clear()
+    with _export_lock:
+        _export_cache.clear()
+    return count
+
+
+@app.route('/api/import', methods=['POST'])
+def import_data():
+    """Queue an import and return its job id immediately.
+
+    Parsing a big sheet used to run inline and hold the HTTP thread
+    for its whole duration; the upload is now captured (to memory or a
+    spill file) while the request stream is still open, handed to the
+    import worker, and the response goes out in milliseconds with 202
+    and a job id to poll at ``/api/import/<job_id>``.
+    """
+    file = request.files.get('file')
+    if file is None:
+        return jsonify({'success': False, 'error': 'no file'}), 400
+    currency = request.form.get('currency')
+    if (request.content_length or 0) > _SPILL_MIN_BYTES:
+        # Sheets too big to hold in RAM spill to disk through the big
+        # reusable buffer, and the on-disk path keeps the importer's
+        # huge-sheet streaming mode available.  The worker unlinks the
+        # spill file when it finishes.
+        tmp = tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False)
+        tmp.close()
+        _spill_upload(file.stream, tmp.name)
+        job_id = _submit_import(_run_import, tmp.name, currency, tmp.name)
+    else:
+        # Small uploads stay in memory: no filesystem round-trip at all.
+        buf = io.BytesIO()
+        file.save(buf)
+        buf.seek(0)
+        job_id = _submit_import(_run_import, buf, currency)
+    return jsonify({'success': True, 'job_id': job_id}), 202
+
+
+@app.route('/api/import/<job_id>')
+def import_status(job_id):
+    with _import_jobs_lock:
+        future = _import_jobs.get(job_id)
+    if future is None:
+        return jsonify({'success': False, 'error': 'unknown job'}), 404
+    if not future.done():
+        return jsonify({'success': True, 'status': 'running'})
+    try:
+        count = future.result()
+    except Exception as exc:
+        return jsonify({'success': False, 'status': 'failed',
+                        'error': str(exc)})
+    return jsonify({'success': True, 'status': 'done', 'count': count})
+
+
+@app.route('/api/forward-pricing', methods=['POST'])
+def forward_pricing():
+    payload = request.json
+    try:
+        result = pricer.price_forward_swap(
+            payload['notional'],
+            payload['fixed_rate'],
+            date.fromisoformat(payload['start_date']),
+            payload['maturity_years'],
+            {int(k): float(v) for k, v in payload['projection_curve'].items()},
+            {int(k): float(v) for k, v in payload['discount_curve'].items()},
+            frequency=payload.get('frequency', 2),
+            spread=payload.get('spread', 0.0),
+        )
+    except (KeyError, ValueError) as exc:
+        return jsonify({'success': False, 'error': str(exc)}), 400
+    return jsonify({'success': True, 'data': result})
+
+
+if __name__ == '__main__':
+    # Werkzeug's dev server handles one request at a time, so a slow
+    # /api/import stalls every /api/rates behind it.  Production runs
+    # one worker — sharing the WAL page cache and the QueuePool — with
+    # a thread pool for the read-heavy GETs; WAL lets those readers
+    # proceed while an import holds the write lock:
+    #   gunicorn -w 1 -k gthread --threads 16 --timeout 120 \
+    #       backend.web_app:app
+    # Direct invocation serves the same model via waitress when it is
+    # installed, falling back to the threaded dev server otherwise.
+    port = int(os.environ.get('WEB_PORT', 5000))
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host='0.0.0.0', port=port, threaded=True)
+    else:
+        serve(app, host='0.0.0.0', port=port, threads=16)